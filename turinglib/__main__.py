@@ -3,9 +3,6 @@
 Entry point for running turinglib via `python -m turinglib`.
 """
 
-import sys
-from . import core
-
 def main():
     print("TuringLib - a minimal Turing Machine simulator")
 
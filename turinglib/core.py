@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import Callable, Optional, Union
-from enum import Enum
+import copy
+import sys
+import weakref
+from array import array
+from typing import Any, Callable, Optional
 
 
 class TapeVar:
@@ -19,8 +22,15 @@ class TapeVar:
 
     Notes
     -----
-    TapeVar objects are immutable, hashable, and comparable by value.
-    They can be safely used as dictionary keys in state transition tables.
+    TapeVar objects are immutable and interned: constructing a TapeVar with a
+    notation that has been seen before returns the existing instance. Equality
+    and hashing are therefore identity-based, which keeps dictionary lookups in
+    state transition tables as cheap as possible. The intern table holds its
+    instances weakly, so a symbol that is no longer referenced is freed.
+
+    Each live TapeVar also has a small integer ``_id``, used to index the
+    per-state transition tables. Ids of freed symbols are handed out again,
+    so they stay bounded by the number of symbols alive at once.
 
     Examples
     --------
@@ -28,16 +38,34 @@ class TapeVar:
     >>> blank = TapeVar(None)
     >>> print(zero, blank)
     0 _
-    >>> zero == TapeVar(0)
+    >>> zero is TapeVar(0)
     True
     >>> blank.is_blank
     True
     """
 
-    __slots__ = ("_notation",)
-
-    def __init__(self, notation: Optional[str | int]):
-        object.__setattr__(self, "_notation", notation)
+    __slots__ = ("_notation", "_id", "__weakref__")
+
+    _intern: weakref.WeakValueDictionary[Any, TapeVar] = weakref.WeakValueDictionary()
+    _free_ids: list[int] = []
+    _next_id = 0
+
+    def __new__(cls, notation: Optional[str | int]):
+        """Return the canonical TapeVar for ``notation``, creating it on first use."""
+        tv = cls._intern.get(notation)
+        if tv is None:
+            tv = super().__new__(cls)
+            object.__setattr__(tv, "_notation", notation)
+            if cls._free_ids:
+                ident = cls._free_ids.pop()
+            else:
+                ident = TapeVar._next_id
+                TapeVar._next_id += 1
+            object.__setattr__(tv, "_id", ident)
+            # Return the id for reuse once the symbol is freed
+            weakref.finalize(tv, cls._free_ids.append, ident).atexit = False
+            cls._intern[notation] = tv
+        return tv
 
     @property
     def notation(self):
@@ -57,13 +85,9 @@ class TapeVar:
         """Return '_' for blank, or the symbol itself as a string."""
         return "_" if self.notation is None else str(self.notation)
 
-    def __eq__(self, other):
-        """Compare two TapeVar objects for symbol equality."""
-        return isinstance(other, TapeVar) and self.notation == other.notation
-
-    def __hash__(self):
-        """Compute a hash based on the symbol value."""
-        return hash(self.notation)
+    def __reduce__(self):
+        """Pickle and copy by notation so the interned instance is preserved."""
+        return TapeVar, (self._notation,)
 
 
 BLANK = TapeVar(None)
@@ -72,8 +96,8 @@ The blank tape symbol (⊔) used by the Turing Machine.
 
 The canonical blank symbol used by the Turing Machine.
 
-Equivalent to `TapeVar(None)`, but provided as a shared constant
-for convenience and identity clarity.
+Since TapeVars are interned, `TapeVar(None)` always returns this very
+object, so blank checks can use ``is BLANK``.
 
 Represents an empty cell on the tape.
 Internally, this is a `TapeVar` with `notation=None`, 
@@ -105,34 +129,74 @@ class ActionPrimitive:
     ----------
     notation : str
         A short label for the action (usually 'R', 'L', or 'N').
-    op : Callable[[int], int]
+    op : Callable[[int], int], optional
         A function that takes the current head index and returns
         the new head position.
+    delta : int, optional
+        Keyword-only. Declares the action as a constant shift of the head by
+        `delta` cells, so the head is moved by plain integer addition instead
+        of calling `op`. If `op` is omitted, it is derived from `delta`. At
+        least one of `op` and `delta` is required. The `op` of an action
+        declared this way cannot be reassigned.
 
     Examples
     --------
     >>> right = ActionPrimitive("R", lambda h: h + 1)
     >>> right.perform(3)
     4
+    >>> ActionPrimitive("R2", delta=2).perform(3)
+    5
     """
 
-    def __init__(self, notation: str, op: Callable[[int], int]):
-        self.notation = notation
-        self.op = op
+    __slots__ = ("notation", "_op", "_delta")
+
+    def __init__(
+        self,
+        notation: str,
+        op: Optional[Callable[[int], int]] = None,
+        *,
+        delta: Optional[int] = None,
+    ):
+        self.notation = sys.intern(notation) if isinstance(notation, str) else notation
+        if delta is None and op is None:
+            raise TypeError("ActionPrimitive requires an op or a delta")
+        self._op = op if op is not None else (lambda h: h + delta)
+        self._delta = delta
+
+    @property
+    def op(self) -> Callable[[int], int]:
+        """The head movement function."""
+        return self._op
+
+    @op.setter
+    def op(self, op: Callable[[int], int]):
+        # Compiled rules move the head by the declared delta, not through op
+        if self._delta is not None:
+            raise AttributeError(f"op of {self.notation!r} is fixed by its declared delta")
+        self._op = op
 
     def __repr__(self):
         """Return the action notation (e.g. 'R', 'L', or 'N')."""
         return str(self.notation)
 
+    @property
+    def value(self) -> ActionPrimitive:
+        """Return the primitive itself, so code written as ``Action.R.value`` keeps working."""
+        return self
+
     def perform(self, head):
         """Apply the head movement function and return the new head index."""
-        return self.op(head)
+        delta = self._delta
+        return head + delta if delta is not None else self._op(head)
 
 
-class Action(Enum):
+class Action:
     """
     Defines the set of basic head movement actions for the Turing Machine.
 
+    The members are plain class attributes holding ActionPrimitive instances,
+    so ``Action.R`` is the primitive itself and can be used directly.
+
     Members
     -------
     R : ActionPrimitive
@@ -144,17 +208,69 @@ class Action(Enum):
 
     Examples
     --------
-    >>> Action.R.value.perform(2)
+    >>> Action.R.perform(2)
     3
-    >>> Action.L.value.perform(2)
+    >>> Action.L.perform(2)
     1
-    >>> Action.N.value.perform(2)
+    >>> Action.N.perform(2)
     2
     """
 
-    R = ActionPrimitive("R", lambda h: h + 1)
-    L = ActionPrimitive("L", lambda h: h - 1)
-    N = ActionPrimitive("N", lambda h: h)
+    R = ActionPrimitive("R", delta=1)
+    L = ActionPrimitive("L", delta=-1)
+    N = ActionPrimitive("N", delta=0)
+
+
+class _Transitions(dict):
+    """
+    The transitions dict held by a State.
+
+    Every in-place change recompiles the owning state's table, so edits such
+    as ``state.transitions[tv] = rule`` take effect without a reassignment
+    and lookups never have to check whether the table is stale.
+    """
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: State, transitions: dict):
+        super().__init__(transitions)
+        self._state = state
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._state._compile()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._state._compile()
+
+    def __ior__(self, other):
+        super().__ior__(other)
+        self._state._compile()
+        return self
+
+    def clear(self):
+        super().clear()
+        self._state._compile()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._state._compile()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._state._compile()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._state._compile()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._state._compile()
 
 
 class State:
@@ -171,7 +287,7 @@ class State:
     ----------
     notation : str
         A short label identifying this state (e.g. "q0", "HALT").
-    transitions : dict[TapeVar, tuple[State, TapeVar, Union[Action, ActionPrimitive]]]
+    transitions : dict[TapeVar, tuple[State, TapeVar, ActionPrimitive]]
         A mapping from the currently read TapeVar to a tuple of:
         (next_state, symbol_to_write, head_action).
 
@@ -185,6 +301,13 @@ class State:
     If `implicit_blank_halt` is True and no transition is defined for the blank
     symbol, the machine halts when encountering a blank cell.
 
+    Transitions are compiled into a list indexed by ``TapeVar._id`` whenever
+    `transitions` is assigned. The state keeps its own copy of the given dict
+    and recompiles the list whenever that copy is changed, so edits made
+    through `transitions` (``state.transitions[tv] = rule``, ``del``,
+    ``update``, ...) take effect too. Later changes to the dict object that
+    was originally passed in are not seen; reassign `transitions` instead.
+
     Examples
     --------
     >>> zero, one = TapeVar(0), TapeVar(1)
@@ -195,18 +318,64 @@ class State:
     >>> next_state, new_symbol, new_head = q0.update(zero, 0, True)
     """
 
+    __slots__ = ("notation", "_transitions", "_ttable", "_is_terminal")
+
+    # Counts table compilations across all states, so a machine can tell in
+    # O(1) that none of its states can have changed since it last looked
+    _epoch = 0
+
     def __init__(
         self,
         notation: str,
-        transitions: dict[TapeVar, tuple[State, TapeVar, Union[Action, ActionPrimitive]]],
+        transitions: dict[TapeVar, tuple[State, TapeVar, ActionPrimitive]],
     ):
-        self.notation = notation
+        self.notation = sys.intern(notation) if isinstance(notation, str) else notation
         self.transitions = transitions
 
+    @property
+    def transitions(self) -> dict[TapeVar, tuple[State, TapeVar, ActionPrimitive]]:
+        """The transition mapping δ(q, ·) of this state."""
+        return self._transitions
+
+    @transitions.setter
+    def transitions(
+        self, transitions: dict[TapeVar, tuple[State, TapeVar, ActionPrimitive]]
+    ):
+        self._transitions = _Transitions(self, transitions)
+        self._compile()
+
     def __repr__(self):
         """Return the state's notation label (e.g. 'q0' or 'HALT')."""
         return str(self.notation)
 
+    def _compile(self) -> list:
+        """
+        Build the integer-indexed transition table for this state.
+
+        Entry ``i`` holds ``(next_state, write, delta, move)`` for the TapeVar
+        whose ``_id`` is ``i``, or None if no rule is defined. For actions
+        declared with a constant ``delta``, the rule stores that shift and
+        ``move`` is None; otherwise ``move`` is the action's bound `perform`,
+        so an `op` reassigned after compilation is still honoured. The table
+        ends at the largest id among the keys; lookups past its end have no
+        rule. `_is_terminal` is refreshed along with the table.
+        """
+        assert all(
+            isinstance(k, TapeVar) for k in self._transitions
+        ), "Transition keys must be TapeVar"
+
+        table: list = [None] * max((tv._id + 1 for tv in self._transitions), default=0)
+        for tv, (next_state, new_tv, action) in self._transitions.items():
+            delta = action._delta
+            if delta is None:
+                table[tv._id] = (next_state, new_tv, 0, action.perform)
+            else:
+                table[tv._id] = (next_state, new_tv, delta, None)
+        self._ttable = table
+        self._is_terminal = not self._transitions
+        State._epoch += 1
+        return table
+
     def update(
         self, tv: TapeVar, head: int, implicit_blank_halt: bool
     ) -> tuple[State | None, TapeVar, int]:
@@ -221,6 +390,8 @@ class State:
             The current head index.
         implicit_blank_halt : bool
             If True, halts when a blank cell is read without a defined transition.
+            A symbol without a rule halts in any case, so both settings give
+            the same result; the flag is kept for compatibility.
 
         Returns
         -------
@@ -228,23 +399,23 @@ class State:
             (next_state, symbol_to_write, new_head_index).
             If no valid transition exists, next_state is None (machine halts).
         """
-        assert all(
-            isinstance(k, TapeVar) for k in self.transitions
-        ), "Transition keys must be TapeVar"
-
-        if implicit_blank_halt and tv == BLANK and BLANK not in self.transitions:
+        # Halting states have no rules at all
+        if self._is_terminal:
             return None, tv, head
 
-        result = self.transitions.get(tv)
+        # A blank without a rule has no table entry either, so
+        # implicit_blank_halt needs no separate check here.
+        try:
+            result = self._ttable[tv._id]
+        except IndexError:
+            result = None
 
         if result is None:
             return None, tv, head
 
-        next_state, new_tv, action = result
-
-        # Handle both Enum members and direct ActionPrimitive instances
-        primitive = action.value if isinstance(action, Action) else action
-        return next_state, new_tv, primitive.perform(head)
+        next_state, new_tv, delta, move = result
+        new_head = head + delta if move is None else move(head)
+        return next_state, new_tv, new_head
 
 
 class StateMachine:
@@ -267,7 +438,8 @@ class StateMachine:
         The index on the input tape where the head begins. Must satisfy
         0 <= start_point < len(input_tape).
     verbose : bool, default=True
-        If True, prints the tape state after each step.
+        If True, prints the tape state after each step. Output is collected
+        and written once per `step`/`run` call rather than once per step.
     implicit_blank_halt : bool, default=True
         If True, halts automatically when encountering a blank cell without a
         defined transition.
@@ -281,6 +453,10 @@ class StateMachine:
     tape_begin : int
         The coordinate corresponding to tape[0]. Maintains alignment between
         the mathematical tape and its list representation.
+    tape : list[TapeVar]
+        A decoded snapshot of the tape. Internally the tape is stored as a
+        ``bytearray`` of ids into the machine's own alphabet; modifying the
+        returned list does not affect the machine.
 
     Notes
     -----
@@ -289,9 +465,41 @@ class StateMachine:
         index = head - tape_begin
 
     This allows correct indexing even as the tape grows in either direction.
+    The cell buffer keeps blank slack on both sides of the visited region
+    (preallocated when the tape is loaded and doubled each time it runs out),
+    so growing the tape in either direction is amortized O(1).
     The machine halts when no valid transition is found for the current symbol.
+
+    On construction, every state reachable from `start` is given an integer id
+    and the machine compiles a single transition matrix indexed by
+    ``[state_id][symbol_id]``. Symbol ids are numbered per machine, in the
+    order symbols are first seen on its tapes and in its transitions, with
+    BLANK always at 0. At the start of every `step`/`run` call, the
+    compiled states are checked for changed transitions, whether reassigned
+    or edited in place, and the matrix is recompiled if any has changed. The
+    check is O(1) unless some state was recompiled since the previous call.
     """
 
+    __slots__ = (
+        "_cells",
+        "implicit_blank_halt",
+        "verbose",
+        "head",
+        "tape_begin",
+        "_end",
+        "_offset",
+        "_threaded",
+        "_start",
+        "_states",
+        "_state_ids",
+        "_table",
+        "_current_id",
+        "_sources",
+        "_epoch",
+        "_symbols",
+        "_symbol_ids",
+    )
+
     def __init__(
         self,
         start: State,
@@ -300,21 +508,153 @@ class StateMachine:
         verbose: bool = True,
         implicit_blank_halt: bool = True,
     ):
+        self.implicit_blank_halt = implicit_blank_halt
+        self.verbose = verbose
+
+        # this machine's tape alphabet: symbol id -> TapeVar, and the reverse
+        self._symbols = [BLANK]
+        self._symbol_ids = {BLANK: 0}
+        self._cells = bytearray()
+        self._load(input_tape, start_point)
+
+        # memoized result of _threaded_rows() and the matrix it was built from
+        self._threaded: tuple[list[list], list[list] | None] | None = None
+
+        # kept so that run_batch can run the program from its beginning
+        self._start = start
+        self._compile(start)
+
+    def _load(self, input_tape: list[TapeVar], start_point: int):
+        """Encode `input_tape` into the cell buffer and place the head at `start_point`."""
         assert 0 <= start_point < len(input_tape)
         assert isinstance(input_tape[start_point], TapeVar)
 
-        self.tape = input_tape
-        self.implicit_blank_halt = implicit_blank_halt
-        self.verbose = verbose
+        # Tape cells hold alphabet ids; bytearray unless it has more than 256 symbols.
+        # The input is surrounded by blank slack so early growth needs no copying.
+        self._add_symbols(input_tape)
+        symbol_ids = self._symbol_ids
+        ids = [symbol_ids[tv] for tv in input_tape]
+        pad = len(ids) + 8
+        blanks = [0] * pad
+        cells = blanks + ids + blanks
+        self._cells = bytearray(cells) if len(self._symbols) <= 256 else array("I", cells)
 
         # managed by the TM
-        self.current = start
         self.head = start_point
         self.tape_begin = 0
+        # coordinate just past the last visited cell; the buffer may extend further
+        self._end = len(input_tape)
+        # buffer index of coordinate 0; grows as left slack is added
+        self._offset = pad
 
     def __str__(self):
         """Return a short string summarizing the current state, head, and symbol."""
-        return f"State={self.current}, Head={self.head}, TapeValue={self.tape[self.head - self.tape_begin]}"
+        tape_value = self._symbols[self._cells[self.head + self._offset]]
+        return f"State={self.current}, Head={self.head}, TapeValue={tape_value}"
+
+    @property
+    def current(self) -> State | None:
+        """The current active state, or None once the machine has halted."""
+        if self._current_id is None:
+            return None
+        return self._states[self._current_id]
+
+    @current.setter
+    def current(self, state: State | None):
+        if state is None:
+            self._current_id = None
+        elif state in self._state_ids:
+            self._current_id = self._state_ids[state]
+        else:
+            self._compile(state)
+
+    @property
+    def tape(self) -> list[TapeVar]:
+        """Return the tape contents decoded back into TapeVar symbols."""
+        symbols = self._symbols
+        offset = self._offset
+        return [symbols[i] for i in self._cells[self.tape_begin + offset : self._end + offset]]
+
+    def _add_symbols(self, symbols):
+        """Give every TapeVar in `symbols` an id in this machine's alphabet."""
+        alphabet = self._symbols
+        symbol_ids = self._symbol_ids
+        for tv in symbols:
+            if tv not in symbol_ids:
+                symbol_ids[tv] = len(alphabet)
+                alphabet.append(tv)
+
+        # Ids past 255 no longer fit a bytearray cell
+        if len(alphabet) > 256 and isinstance(self._cells, bytearray):
+            self._cells = array("I", list(self._cells))
+
+    def _compile(self, current: State | None):
+        """
+        Compile every state reachable from the start state or from `current`
+        into one transition matrix, and make `current` the current state.
+
+        States are numbered in breadth-first order from the start state
+        (which gets id 0), and ``self._table[state_id][symbol_id]`` holds
+        ``(next_state_id, write_id, delta, move)`` or None, mirroring the
+        per-state tables built by `State._compile`. The tables used are kept
+        in ``self._sources`` so that `_refresh` can tell when any of them is
+        recompiled (each compilation builds a new list). Symbols they
+        mention are added to the machine's alphabet.
+        """
+        states = [self._start]
+        state_ids = {self._start: 0}
+        if current is not None and current not in state_ids:
+            state_ids[current] = 1
+            states.append(current)
+        for state in states:
+            for next_state, _, _ in state.transitions.values():
+                if next_state is not None and next_state not in state_ids:
+                    state_ids[next_state] = len(states)
+                    states.append(next_state)
+
+        sources = [state._ttable for state in states]
+        for state, ttable in zip(states, sources):
+            self._add_symbols(state._transitions)
+            self._add_symbols(rule[1] for rule in ttable if rule is not None)
+
+        symbol_ids = self._symbol_ids
+        size = len(self._symbols)
+        table = []
+        # Every state without transitions shares one all-None row
+        halt_row: list = [None] * size
+        for state, ttable in zip(states, sources):
+            if state._is_terminal:
+                table.append(halt_row)
+                continue
+            row: list = [None] * size
+            for tv in state._transitions:
+                next_state, new_tv, delta, move = ttable[tv._id]
+                # A rule leading to no state halts, just like a missing rule
+                if next_state is not None:
+                    row[symbol_ids[tv]] = (state_ids[next_state], symbol_ids[new_tv], delta, move)
+            table.append(row)
+
+        self._states = states
+        self._state_ids = state_ids
+        self._table = table
+        self._current_id = None if current is None else state_ids[current]
+        self._sources = sources
+        self._epoch = State._epoch
+
+    def _refresh(self):
+        """
+        Recompile the matrix if the transitions of any compiled state changed
+        since, or if symbols were added to the alphabet after it was built.
+        """
+        if len(self._table[0]) != len(self._symbols):
+            self._compile(self.current)
+            return
+        # Nothing was compiled anywhere since the last check: no scan needed
+        if self._epoch == State._epoch:
+            return
+        self._epoch = State._epoch
+        if any(state._ttable is not ttable for state, ttable in zip(self._states, self._sources)):
+            self._compile(self.current)
 
     def step(self):
         """
@@ -325,65 +665,280 @@ class StateMachine:
         bool
             True if the machine continues execution, False if it halts.
         """
+        _, halted = self._execute(1, self.verbose)
+        return not halted
 
-        # Read the current tape symbol
-        index = self.head - self.tape_begin
-        tape_value = self.tape[index]
+    def run(self, max_steps: int = 1000):
+        """
+        Run the Turing Machine until halt or until the step limit is reached.
 
-        # Apply the transition δ(q, a) → (q', b, D)
-        next_state, new_tv, new_head = self.current.update(
-            tape_value, self.head, self.implicit_blank_halt
-        )
+        Parameters
+        ----------
+        max_steps : int, default=1000
+            The maximum number of steps to execute before stopping.
 
-        # Halt condition: no valid transition
-        if next_state is None:
-            if self.verbose:
-                print("===== MACHINE HALTED: NO DEFINED TRANSITIONS =====")
-                print(self)
-            return False
+        Returns
+        -------
+        tuple[list[TapeVar], State | None]
+            The final tape and the current state (None once the machine has halted).
 
-        # Write new symbol b
-        self.tape[index] = new_tv
+        Notes
+        -----
+        The loop is chosen once per call: quiet machines run the specialised
+        loop of `run_fast`, so the per-step path never tests `verbose`.
+        """
+        if not self.verbose:
+            return self.run_fast(max_steps)
+        steps, _ = self._execute(max_steps, True)
+        print(f"Machine halted after {steps} steps.")
+        return self.tape, self.current
 
-        # Extend tape right if needed
-        while new_head - self.tape_begin >= len(self.tape):
-            if len(self.tape) > 10**6:
-                raise MemoryError("tape length execeed safety limits")
-            self.tape.append(BLANK)
+    def run_fast(self, max_steps: int = 1000):
+        """
+        Run the machine like `run`, but without any printing.
 
-        # Extend tape left if needed
-        while self.tape_begin > new_head:
-            if len(self.tape) > 10**6:
-                raise MemoryError("tape length execeed safety limits")
-            self.tape.insert(0, BLANK)
-            self.tape_begin -= 1
+        Before the loop starts, every row of the transition matrix is rewritten
+        so that each rule points directly at the row of its next state. The
+        inner loop then never indexes the matrix: a step is one list index,
+        one tuple unpack (writing straight into the tape) and an integer
+        addition. Machines using actions without a declared delta fall
+        back to the regular loop.
 
-        # Update head and state
-        self.head = new_head
-        self.current = next_state
+        Parameters
+        ----------
+        max_steps : int, default=1000
+            The maximum number of steps to execute before stopping.
 
-        if self.verbose:
-            print(self)
+        Returns
+        -------
+        tuple[list[TapeVar], State | None]
+            The final tape and the current state (None once the machine has halted).
+        """
+        rows = self._threaded_rows() if self._current_id is not None else None
+        if rows is None:
+            self._execute(max_steps, verbose=False)
+            return self.tape, self.current
+
+        tape = self._cells
+        head = self.head
+        tape_begin = self.tape_begin
+        offset = self._offset
+        end = self._end
+        current_id = self._current_id
+        row = rows[current_id]
+
+        try:
+            for _ in range(max_steps):
+                index = head + offset
+                rule = row[tape[index]]
+                if rule is None:
+                    current_id = None
+                    break
+                next_row, tape[index], delta, next_id = rule
+                head += delta
+                if not tape_begin <= head < end:
+                    self.tape_begin, self._offset = tape_begin, offset
+                    try:
+                        self._grow(head)
+                    except MemoryError:
+                        # Leave the machine in the configuration it could not leave
+                        head -= delta
+                        raise
+                    tape_begin, offset = self.tape_begin, self._offset
+                    end = self._end
+                row, current_id = next_row, next_id
+        finally:
+            self._current_id, self.head, self.tape_begin = current_id, head, tape_begin
+            self._offset = offset
 
-        return True
+        return self.tape, self.current
 
-    def run(self, max_steps: int = 1000):
+    def run_batch(
+        self, tapes: list[list[TapeVar]], start_point: int = 0, max_steps: int = 1000
+    ) -> list[tuple[list[TapeVar], State | None]]:
         """
-        Run the Turing Machine until halt or until the step limit is reached.
+        Run the machine's program on several independent input tapes.
+
+        Each tape is run with `run_fast` from this machine's start state,
+        with the head at `start_point`, whatever state this machine itself
+        has reached. The compiled transition matrix and
+        its linked rows are built once and shared by every run; this
+        machine's own tape and configuration are left untouched.
 
         Parameters
         ----------
+        tapes : list[list[TapeVar]]
+            The input tapes to run.
+        start_point : int, default=0
+            The index on each input tape where the head begins.
         max_steps : int, default=1000
-            The maximum number of steps to execute before stopping.
+            The maximum number of steps to execute per tape.
 
         Returns
         -------
-        tuple[list[TapeVar], State]
-            The final tape and the last active state.
+        list[tuple[list[TapeVar], State | None]]
+            The final tape and state of each run, in input order.
         """
+        # Number every symbol up front, so the forks share one alphabet and one
+        # matrix wide enough for all of their tapes
+        for tape in tapes:
+            self._add_symbols(tape)
+        self._threaded_rows()
+
+        return [self._fork(tape, start_point).run_fast(max_steps) for tape in tapes]
+
+    def _fork(self, input_tape: list[TapeVar], start_point: int) -> StateMachine:
+        """Return a quiet copy of this machine that shares its program but runs on `input_tape`."""
+        tm = copy.copy(self)
+        tm.verbose = False
+        tm._load(input_tape, start_point)
+        # the start state always has id 0
+        tm._current_id = 0
+        return tm
+
+    def _threaded_rows(self) -> list[list] | None:
+        """
+        Build matrix rows whose rules link directly to the row of their next state.
 
-        for _ in range(max_steps):
-            if not self.step():
-                break
-        print(f"Machine halted after {_ + 1} steps.")
-        return self.tape, self.current
+        Each rule becomes ``(next_row, write_id, delta, next_state_id)``.
+        Returns None if any rule needs a custom `move` callable. The result is
+        memoized until the transition matrix is recompiled.
+        """
+        self._refresh()
+        table = self._table
+        cached = self._threaded
+        if cached is not None and cached[0] is table:
+            return cached[1]
+
+        rows = None
+        if all(rule is None or rule[3] is None for row in table for rule in row):
+            rows = [[None] * len(row) for row in table]
+            for row, linked in zip(table, rows):
+                for symbol, rule in enumerate(row):
+                    if rule is not None:
+                        next_id, write_id, delta, _ = rule
+                        linked[symbol] = (rows[next_id], write_id, delta, next_id)
+        self._threaded = (table, rows)
+        return rows
+
+    def _grow(self, new_head: int):
+        """
+        Extend the visited region of the tape so that it contains `new_head`.
+
+        Cells within the blank slack on either side of the region are simply
+        taken into it. When the slack on a side runs out, the buffer is
+        extended on that side by at least as many cells as it already holds,
+        in a single operation.
+        """
+        tape = self._cells
+        offset = self._offset
+
+        # Extend tape right if needed
+        if new_head >= self._end:
+            if new_head + 1 - self.tape_begin > 10**6:
+                raise MemoryError("tape length execeed safety limits")
+            need = new_head + offset + 1 - len(tape)
+            if need > 0:
+                tape.extend(self._blanks(max(need, len(tape))))
+            self._end = new_head + 1
+
+        # Extend tape left if needed
+        if new_head < self.tape_begin:
+            if self._end - new_head > 10**6:
+                raise MemoryError("tape length execeed safety limits")
+            need = -(new_head + offset)
+            if need > 0:
+                pad = max(need, len(tape))
+                tape[:0] = self._blanks(pad)
+                self._offset = offset + pad
+            self.tape_begin = new_head
+
+    def _blanks(self, count: int):
+        """Return `count` blank cells in the same container type as the tape."""
+        cell = self._cells[:1]
+        # BLANK is id 0 in every machine's alphabet
+        cell[0] = 0
+        return cell * count
+
+    def _execute(self, max_steps: int, verbose: bool) -> tuple[int, bool]:
+        """
+        Execute up to `max_steps` transitions, printing each one if `verbose`.
+
+        This is the machine's inner loop: the transition lookup of
+        `State.update` is replaced by an index into the compiled matrix, and
+        the machine configuration is kept in local variables, which are
+        written back to the instance when the loop exits. Verbose lines are
+        formatted from those locals and printed in one go at the end.
+
+        Returns
+        -------
+        tuple[int, bool]
+            The number of steps attempted (including the one that found no
+            transition) and whether the machine halted.
+        """
+        self._refresh()
+        current_id = self._current_id
+        if current_id is None:
+            return 0, True
+
+        table = self._table
+        tape = self._cells
+        head = self.head
+        tape_begin = self.tape_begin
+        offset = self._offset
+        end = self._end
+        if verbose:
+            states = self._states
+            symbols = self._symbols
+            lines: list[str] = []
+
+        halted = False
+        steps = 0
+        try:
+            while steps < max_steps:
+                steps += 1
+
+                # Read the current tape symbol and look up δ(q, a). A blank
+                # without a rule has no matrix entry either, so
+                # implicit_blank_halt needs no separate check here.
+                index = head + offset
+                rule = table[current_id][tape[index]]
+
+                # Halt condition: no valid transition
+                if rule is None:
+                    halted = True
+                    break
+
+                # Write new symbol b, change to q' and move the head by D
+                next_id, tape[index], delta, move = rule
+                new_head = head + delta if move is None else move(head)
+
+                # Extend tape if the head left the visited region; the head
+                # and state only change once the tape contains its target
+                if not tape_begin <= new_head < end:
+                    self.tape_begin, self._offset = tape_begin, offset
+                    self._grow(new_head)
+                    tape_begin, offset = self.tape_begin, self._offset
+                    end = self._end
+                head, current_id = new_head, next_id
+
+                if verbose:
+                    # Same format as __str__
+                    lines.append(
+                        f"State={states[current_id]}, Head={head}, "
+                        f"TapeValue={symbols[tape[head + offset]]}"
+                    )
+        finally:
+            self._current_id, self.head, self.tape_begin = current_id, head, tape_begin
+            self._offset = offset
+            if verbose:
+                if halted:
+                    lines.append("===== MACHINE HALTED: NO DEFINED TRANSITIONS =====")
+                    lines.append(str(self))
+                if lines:
+                    print("\n".join(lines))
+
+        if halted:
+            self._current_id = None
+
+        return steps, halted
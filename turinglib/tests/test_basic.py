@@ -1,4 +1,9 @@
 # tests/test_core.py
+import copy
+import gc
+import pickle
+import weakref
+
 import pytest
 from turinglib import TapeVar, State, StateMachine, Action, ActionPrimitive, BLANK
 
@@ -17,6 +22,28 @@ def test_tapevar_equality_and_hash():
     assert TapeVar(None).is_blank
 
 
+def test_tapevar_is_interned():
+    """Constructing the same notation twice should return the same object."""
+    assert TapeVar(0) is TapeVar(0)
+    assert TapeVar("A") is not TapeVar("B")
+    assert TapeVar(None) is BLANK
+    assert copy.deepcopy(TapeVar(1)) is TapeVar(1)
+    assert pickle.loads(pickle.dumps(TapeVar("A"))) is TapeVar("A")
+
+
+def test_unused_tapevars_are_freed():
+    """Interning should not keep symbols alive once nothing else refers to them."""
+    ref = weakref.ref(TapeVar("short-lived"))
+    gc.collect()
+    assert ref() is None
+
+    # Symbols created after a freed one still get their own transitions
+    a, b = TapeVar("reused-a"), TapeVar("reused-b")
+    q0 = State("q0", {a: (None, b, Action.R)})
+    assert q0.update(a, 0, implicit_blank_halt=True) == (None, b, 1)
+    assert q0.update(b, 0, implicit_blank_halt=True) == (None, b, 0)
+
+
 def test_blank_constant_equivalence():
     """BLANK should be equal to TapeVar(None)."""
     assert BLANK == TapeVar(None)
@@ -41,6 +68,14 @@ def test_action_perform():
     assert Action.L.value.perform(0) == -1
     assert Action.N.value.perform(5) == 5
 
+
+def test_action_members_are_primitives():
+    """Action members should be usable directly, without going through .value."""
+    assert Action.R.perform(0) == 1
+    assert Action.L.perform(0) == -1
+    assert Action.N.perform(5) == 5
+    assert Action.R.value is Action.R
+
 def test_custom_actionprimitive():
     """Custom ActionPrimitives should behave as defined."""
     R2 = ActionPrimitive("R2", lambda h: h + 2)
@@ -48,6 +83,53 @@ def test_custom_actionprimitive():
     assert repr(R2) == "R2"
 
 
+def test_notations_are_interned():
+    """Equal string labels of actions and states should be the same object."""
+    action = ActionPrimitive("".join(["R", "2"]), delta=2)
+    state = State("".join(["R", "2"]), {})
+    assert action.notation is state.notation
+
+
+def test_actionprimitive_declared_delta():
+    """An explicit delta should define the movement without probing op."""
+    R2 = ActionPrimitive("R2", delta=2)
+    assert R2.perform(5) == 7
+    assert R2.op(5) == 7
+
+    calls = []
+    logged = ActionPrimitive("LOG", lambda h: calls.append(h) or h + 1, delta=1)
+    assert logged.perform(5) == 6
+    assert calls == []
+
+    with pytest.raises(TypeError):
+        ActionPrimitive("X")
+
+
+def test_actionprimitive_op_is_always_called():
+    """Actions given only an op should call it, even if it looks like a shift nearby."""
+    calls = []
+    clamp = ActionPrimitive("C", lambda h: calls.append(h) or min(h + 1, 5))
+    assert calls == []
+    assert clamp.perform(0) == 1
+    assert clamp.perform(10) == 5
+    assert calls == [0, 10]
+
+    # Undeclared actions may have their op replaced
+    clamp.op = lambda h: 0
+    assert clamp.perform(7) == 0
+
+
+def test_actionprimitive_declared_delta_fixes_op():
+    """The op of an action declared with a delta cannot be reassigned."""
+    step = ActionPrimitive("S", delta=4)
+    with pytest.raises(AttributeError):
+        step.op = lambda h: 0
+    assert step.perform(7) == 11
+    with pytest.raises(AttributeError):
+        Action.R.op = lambda h: h - 1
+    assert Action.R.perform(0) == 1
+
+
 # ---------------------------------------------------------------------
 # State Tests
 # ---------------------------------------------------------------------
@@ -75,6 +157,69 @@ def test_state_halts_on_no_transition():
     assert new_head == 0
 
 
+def test_state_blank_without_rule_halts_regardless_of_flag():
+    """A blank with no rule halts whether or not implicit_blank_halt is set."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q0 = State("q0", {zero: (None, one, Action.R)})
+    for flag in (True, False):
+        assert q0.update(BLANK, 4, implicit_blank_halt=flag) == (None, BLANK, 4)
+
+
+def test_state_reassigned_transitions_take_effect():
+    """Assigning a new transitions dict should replace the compiled table."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q1 = State("q1", {})
+    q0 = State("q0", {zero: (q1, one, Action.R)})
+    assert q0.update(zero, 0, implicit_blank_halt=True)[0] is q1
+
+    q0.transitions = {one: (q1, zero, Action.L)}
+    assert q0.update(zero, 0, implicit_blank_halt=True)[0] is None
+    assert q0.update(one, 0, implicit_blank_halt=True) == (q1, zero, -1)
+
+    # A symbol interned after the table was compiled has no rule
+    assert q0.update(TapeVar("fresh-symbol"), 3, implicit_blank_halt=True)[0] is None
+
+
+def test_state_sees_transitions_edited_in_place():
+    """Rules added to or replaced in the transitions dict should be used by update()."""
+    zero, one = TapeVar(0), TapeVar(1)
+    halt = State("HALT", {})
+    q0 = State("q0", {zero: (halt, zero, Action.N)})
+    q0.transitions[zero] = (halt, one, Action.R)
+    assert q0.update(zero, 0, implicit_blank_halt=True) == (halt, one, 1)
+    q0.transitions[one] = (q0, zero, Action.L)
+    assert q0.update(one, 0, implicit_blank_halt=True) == (q0, zero, -1)
+    del q0.transitions[zero]
+    assert q0.update(zero, 0, implicit_blank_halt=True)[0] is None
+
+    # The state holds its own copy, so the dict that was passed in is left alone
+    original = {one: (halt, one, Action.N)}
+    q0.transitions = original
+    original[zero] = (halt, one, Action.R)
+    assert q0.update(zero, 0, implicit_blank_halt=True)[0] is None
+
+
+def test_state_without_rules_stops_halting_once_a_rule_is_added():
+    """A halting state should take a rule added in place, in update() and in a machine."""
+    zero, one = TapeVar(0), TapeVar(1)
+    halt = State("HALT", {})
+    q0 = State("q0", {})
+    assert q0.update(zero, 0, implicit_blank_halt=True) == (None, zero, 0)
+
+    q0.transitions[zero] = (halt, one, Action.R)
+    assert q0.update(zero, 0, implicit_blank_halt=True) == (halt, one, 1)
+
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    assert tm.run(max_steps=5) == ([one, BLANK], None)
+
+
+def test_state_rejects_non_tapevar_keys():
+    """Transition keys are validated once, when the table is compiled."""
+    q0 = State("q0", {})
+    with pytest.raises(AssertionError):
+        q0.transitions = {0: (q0, TapeVar(1), Action.R)}
+
+
 # ---------------------------------------------------------------------
 # StateMachine Tests
 # ---------------------------------------------------------------------
@@ -106,6 +251,43 @@ def test_machine_left_growth():
     assert len(tm.tape) == 2
 
 
+def test_machine_long_left_walk():
+    """Repeated left growth should keep the visible tape and coordinates consistent."""
+    one = TapeVar(1)
+    q0 = State("q0", {})
+    q0.transitions = {BLANK: (q0, one, Action.L), one: (q0, one, Action.L)}
+    tm = StateMachine(start=q0, input_tape=[one], start_point=0, verbose=False)
+    tm.run(max_steps=500)
+    assert tm.head == -500
+    assert tm.tape_begin == -500
+    assert len(tm.tape) == 501
+    assert tm.tape[0] == BLANK
+    assert all(cell is one for cell in tm.tape[1:])
+
+
+def test_machine_tape_growth_limit():
+    """Growing the tape past the safety limit should raise MemoryError."""
+    zero = TapeVar(0)
+    far = ActionPrimitive("FAR", lambda h: h + 2 * 10**6)
+    q0, q1 = State("q0", {}), State("q1", {})
+    q0.transitions = {zero: (q1, zero, far)}
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    with pytest.raises(MemoryError):
+        tm.step()
+    # Neither the head nor the state moves, so the machine can still be inspected
+    assert tm.head == 0
+    assert tm.current is q0
+    assert str(tm) == "State=q0, Head=0, TapeValue=0"
+
+    far = ActionPrimitive("FAR", delta=2 * 10**6)
+    q0.transitions = {zero: (q1, zero, far)}
+    with pytest.raises(MemoryError):
+        tm.run_fast()
+    assert tm.head == 0
+    assert tm.current is q0
+    assert tm.tape == [zero]
+
+
 def test_machine_respects_start_point():
     """Machine should start reading from the user-specified start_point."""
     tape = [TapeVar(0), TapeVar(1), TapeVar(0)]
@@ -119,6 +301,29 @@ def test_machine_respects_start_point():
     assert tm.tape[1].notation == 0
 
 
+def test_machine_widens_tape_for_large_alphabets():
+    """Growing the machine's alphabet past 256 symbols should work after the tape was loaded."""
+    zero = TapeVar(0)
+    q0 = State("q0", {})
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    symbols = [TapeVar(f"wide-{i}") for i in range(300)]
+    q0.transitions = {tv: (q0, symbols[-1], Action.R) for tv in [*symbols[:-1], zero]}
+    tm.run(max_steps=3)
+    assert tm.tape == [symbols[-1], BLANK]
+
+
+def test_machine_tape_is_decoded_copy():
+    """The machine should encode the tape compactly and leave the input list untouched."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q0 = State("q0", {})
+    q0.transitions = {zero: (q0, one, Action.R)}
+    tape = [zero, zero]
+    tm = StateMachine(start=q0, input_tape=tape, start_point=0, verbose=False)
+    tm.run()
+    assert tape == [zero, zero]
+    assert tm.tape == [one, one, BLANK]
+
+
 def test_machine_halts_properly():
     """Machine should halt when update() returns None as next state."""
     zero = TapeVar(0)
@@ -129,6 +334,101 @@ def test_machine_halts_properly():
     assert tm.current is None
 
 
+def test_machine_non_shift_action():
+    """Actions that are not constant shifts should still be applied via perform()."""
+    zero, one = TapeVar(0), TapeVar(1)
+    jump = ActionPrimitive("J", lambda h: 3 if h == 0 else -2)
+    q0 = State("q0", {})
+    q0.transitions = {zero: (q0, one, jump), BLANK: (q0, one, jump)}
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    assert tm.step()
+    assert tm.head == 3
+    assert tm.step()
+    assert tm.head == -2
+    assert [cell.notation for cell in tm.tape] == [None, None, 1, None, None, 1]
+
+
+def test_machine_calls_op_of_undeclared_actions():
+    """A custom op that only looks like a shift near 0 must still be called on every step."""
+    one = TapeVar(1)
+    clamp = ActionPrimitive("C", lambda h: min(h + 1, 5))
+    q0 = State("q0", {})
+    q0.transitions = {BLANK: (q0, one, clamp), one: (q0, one, clamp)}
+    for run in ("run", "run_fast"):
+        tm = StateMachine(start=q0, input_tape=[BLANK], start_point=0, verbose=False)
+        getattr(tm, run)(max_steps=20)
+        assert tm.head == 5
+        assert len(tm.tape) == 6
+
+
+def test_machine_uses_reassigned_op():
+    """Reassigning an action's op after the machine was built should change how it moves."""
+    one = TapeVar(1)
+    act = ActionPrimitive("A", lambda h: h + 1)
+    q0, q1 = State("q0", {}), State("q1", {})
+    q0.transitions = {BLANK: (q1, one, act)}
+    for run in ("step", "run", "run_fast"):
+        act.op = lambda h: h + 1
+        tm = StateMachine(start=q0, input_tape=[BLANK, BLANK], start_point=1, verbose=False)
+        act.op = lambda h: h - 1
+        getattr(tm, run)()
+        assert tm.head == 0
+        assert tm.tape == [BLANK, one]
+
+
+def test_machine_recompiles_after_transitions_change():
+    """Reassigning transitions between steps should take effect on the next step."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q0, q1 = State("q0", {}), State("q1", {})
+    q0.transitions = {zero: (q0, one, Action.R), BLANK: (q0, zero, Action.R)}
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    assert tm.step()
+    q0.transitions = {BLANK: (q1, one, Action.N)}
+    assert tm.step()
+    assert tm.current is q1
+    assert tm.tape == [one, one]
+
+
+def test_machine_picks_up_rules_added_in_place():
+    """A rule added to a state's dict after the machine was built should be used."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q2 = State("q2", {})
+    tm = StateMachine(start=q2, input_tape=[zero], start_point=0, verbose=False)
+    q2.transitions[zero] = (q2, one, Action.R)
+    tm.run(max_steps=3)
+    assert tm.tape == [one, BLANK]
+
+
+def test_machine_rule_without_next_state_halts():
+    """A rule whose next state is None should halt without writing."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q0 = State("q0", {})
+    q0.transitions = {zero: (None, one, Action.R)}
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    assert tm.step() is False
+    assert tm.current is None
+    assert tm.tape == [zero]
+
+
+def test_machine_verbose_output(capsys):
+    """Verbose runs should report every step and the halt; quiet runs print nothing."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q0 = State("q0", {})
+    q0.transitions = {zero: (q0, one, Action.R)}
+
+    StateMachine(start=q0, input_tape=[zero, zero], start_point=0, verbose=False).run()
+    assert capsys.readouterr().out == ""
+
+    StateMachine(start=q0, input_tape=[zero, zero], start_point=0, verbose=True).run()
+    assert capsys.readouterr().out.splitlines() == [
+        "State=q0, Head=1, TapeValue=0",
+        "State=q0, Head=2, TapeValue=_",
+        "===== MACHINE HALTED: NO DEFINED TRANSITIONS =====",
+        "State=q0, Head=2, TapeValue=_",
+        "Machine halted after 3 steps.",
+    ]
+
+
 def test_custom_action_with_large_move():
     """Machine should handle arbitrary custom head displacements safely."""
     zero, one = TapeVar(0), TapeVar(1)
@@ -140,3 +440,96 @@ def test_custom_action_with_large_move():
     tm = StateMachine(start=q0, input_tape=tape, start_point=0, verbose=False)
     tm.step()
     assert len(tm.tape) >= 4
+
+
+def _bounce_machine():
+    """Sweep right and left across the tape, flipping bits and growing both ends."""
+    zero, one = TapeVar(0), TapeVar(1)
+    r, l = State("r", {}), State("l", {})
+    r.transitions = {zero: (r, one, Action.R), one: (r, zero, Action.R), BLANK: (l, one, Action.L)}
+    l.transitions = {zero: (l, one, Action.L), one: (l, zero, Action.L), BLANK: (r, one, Action.R)}
+    return StateMachine(start=r, input_tape=[zero, one, zero], start_point=0, verbose=False)
+
+
+def test_run_fast_matches_step():
+    """run_fast() should reach exactly the same configuration as repeated step() calls."""
+    slow, fast = _bounce_machine(), _bounce_machine()
+    for _ in range(2000):
+        slow.step()
+    fast.run_fast(max_steps=2000)
+    assert fast.tape == slow.tape
+    assert (fast.head, fast.tape_begin) == (slow.head, slow.tape_begin)
+    assert fast.current.notation == slow.current.notation
+
+
+def test_run_fast_halts_and_falls_back():
+    """run_fast() should halt like run() and handle non-shift actions."""
+    zero, one = TapeVar(0), TapeVar(1)
+    jump = ActionPrimitive("J", lambda h: 5)
+    q0 = State("q0", {})
+    q0.transitions = {zero: (q0, one, jump)}
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    tape, state = tm.run_fast()
+    assert state is None
+    assert tm.head == 5
+    assert [cell.notation for cell in tape] == [1, None, None, None, None, None]
+
+
+def test_run_fast_follows_transitions_changes_between_calls():
+    """Repeated run_fast() calls should continue the run and use reassigned transitions."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q0 = State("q0", {})
+    q0.transitions = {zero: (q0, one, Action.R), BLANK: (q0, zero, Action.R)}
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    tm.run_fast(max_steps=3)
+    tm.run_fast(max_steps=3)
+    assert tm.head == 6
+
+    q0.transitions = {BLANK: (q0, one, Action.L)}
+    tm.run_fast(max_steps=3)
+    assert tm.current is None
+    assert tm.head == 5
+    assert [cell.notation for cell in tm.tape] == [1, 0, 0, 0, 0, 0, 1]
+
+
+def test_run_batch_matches_individual_runs():
+    """run_batch() should give the same results as separate machines, leaving its own tape alone."""
+    zero, one = TapeVar(0), TapeVar(1)
+    flip, halt = State("flip", {}), State("HALT", {})
+    flip.transitions = {
+        zero: (flip, one, Action.R),
+        one: (flip, zero, Action.R),
+        BLANK: (halt, BLANK, Action.N),
+    }
+    tapes = [[zero], [one, zero, one], [one, one, one, one]]
+
+    tm = StateMachine(start=flip, input_tape=[zero, zero], start_point=0, verbose=False)
+    results = tm.run_batch(tapes)
+
+    assert tm.tape == [zero, zero]
+    assert tm.current is flip
+    for input_tape, (tape, state) in zip(tapes, results):
+        single = StateMachine(start=flip, input_tape=input_tape, start_point=0, verbose=False)
+        assert (tape, state) == single.run()
+
+
+def test_run_batch_starts_from_the_start_state():
+    """run_batch() should run from the start state, even after the machine itself halted."""
+    zero, one = TapeVar(0), TapeVar(1)
+    flip = State("flip", {})
+    flip.transitions = {zero: (flip, one, Action.R), one: (flip, zero, Action.R)}
+
+    tm = StateMachine(start=flip, input_tape=[zero], start_point=0, verbose=False)
+    assert tm.run() == ([one, BLANK], None)
+    assert tm.run_batch([[zero, zero]]) == [([one, one, BLANK], None)]
+    assert tm.tape == [one, BLANK]
+    assert tm.current is None
+
+
+def test_run_batch_accepts_symbols_interned_after_compilation():
+    """Tapes may contain symbols the machine's matrix has never seen."""
+    zero, one = TapeVar(0), TapeVar(1)
+    q0 = State("q0", {zero: (State("HALT", {}), one, Action.R)})
+    tm = StateMachine(start=q0, input_tape=[zero], start_point=0, verbose=False)
+    fresh = TapeVar("batch-new-sym")
+    assert tm.run_batch([[fresh], [zero, fresh]]) == [([fresh], None), ([one, fresh], None)]